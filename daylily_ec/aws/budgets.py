@@ -16,6 +16,8 @@ from __future__ import annotations
 import logging
 from typing import Any, Dict, List
 
+from botocore.exceptions import ClientError
+
 from daylily_ec.state.models import CheckResult, CheckStatus
 
 log = logging.getLogger(__name__)
@@ -36,6 +38,12 @@ CLUSTER_THRESHOLDS: List[int] = [75]
 TAGS_FILE_S3_SUFFIX = "data/budget_tags/pcluster-project-budget-tags.tsv"
 """Relative path under the S3 bucket for the budget tags TSV."""
 
+TAGS_FILE_WRITE_ATTEMPTS = 5
+"""Conditional-write attempts before giving up on a contended tags file."""
+
+_CONDITIONAL_WRITE_CONFLICTS = {"PreconditionFailed", "ConditionalRequestConflict"}
+_MISSING_OBJECT_CODES = {"NoSuchKey", "404", "NotFound"}
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -106,13 +114,21 @@ def budget_exists(
 
         aws budgets describe-budgets \\
             --query "Budgets[?BudgetName=='<name>'] | [0].BudgetName"
+
+    Follows ``NextToken`` so accounts with more than one page of budgets
+    are searched in full, and stops at the first matching page.
     """
     try:
-        resp = budgets_client.describe_budgets(AccountId=account_id)
-        for b in resp.get("Budgets", []):
-            if b.get("BudgetName") == budget_name:
-                return True
-        return False
+        params: Dict[str, Any] = {"AccountId": account_id}
+        while True:
+            resp = budgets_client.describe_budgets(**params)
+            for b in resp.get("Budgets", []):
+                if b.get("BudgetName") == budget_name:
+                    return True
+            next_token = resp.get("NextToken")
+            if not next_token:
+                return False
+            params["NextToken"] = next_token
     except Exception:
         log.debug("budget_exists: could not list budgets", exc_info=True)
         return False
@@ -183,25 +199,55 @@ def update_tags_file(
     File path: ``s3://<bucket>/data/budget_tags/pcluster-project-budget-tags.tsv``
 
     Each line: ``<project_name>\\tubuntu,<users>``
+
+    The write is conditional on the object being unchanged since it was read
+    (``IfMatch`` on its ETag, or ``IfNoneMatch`` when creating it), so two
+    clusters created at once cannot drop each other's line; a conflicting
+    write re-reads and retries.
     """
     key = TAGS_FILE_S3_SUFFIX
-    existing = ""
-    try:
-        resp = s3_client.get_object(Bucket=bucket_name, Key=key)
-        existing = resp["Body"].read().decode("utf-8", errors="replace")
-    except Exception:
-        log.debug("Tags file not found; will create a new one")
-
     allowed_users = _normalize_allowed_budget_users(users)
     new_line = f"{project_name}\t{allowed_users}\n"
-    body = existing + new_line
 
-    s3_client.put_object(
-        Bucket=bucket_name,
-        Key=key,
-        Body=body.encode("utf-8"),
+    for attempt in range(1, TAGS_FILE_WRITE_ATTEMPTS + 1):
+        existing = ""
+        etag = None
+        try:
+            resp = s3_client.get_object(Bucket=bucket_name, Key=key)
+            existing = resp["Body"].read().decode("utf-8", errors="replace")
+            etag = resp.get("ETag")
+        except ClientError as exc:
+            # Only a missing object means "create it"; any other read failure
+            # would otherwise surface as endless IfNoneMatch conflicts.
+            if exc.response.get("Error", {}).get("Code", "") not in _MISSING_OBJECT_CODES:
+                raise
+            log.debug("Tags file not found; will create a new one")
+
+        condition = {"IfMatch": etag} if etag else {"IfNoneMatch": "*"}
+        try:
+            s3_client.put_object(
+                Bucket=bucket_name,
+                Key=key,
+                Body=(existing + new_line).encode("utf-8"),
+                **condition,
+            )
+        except ClientError as exc:
+            code = exc.response.get("Error", {}).get("Code", "")
+            if code not in _CONDITIONAL_WRITE_CONFLICTS:
+                raise
+            log.info(
+                "Tags file changed concurrently; retrying (%d/%d)",
+                attempt,
+                TAGS_FILE_WRITE_ATTEMPTS,
+            )
+            continue
+        log.info("Updated tags file s3://%s/%s", bucket_name, key)
+        return
+
+    raise RuntimeError(
+        f"Could not update s3://{bucket_name}/{key}: it kept changing during "
+        f"{TAGS_FILE_WRITE_ATTEMPTS} conditional write attempts"
     )
-    log.info("Updated tags file s3://%s/%s", bucket_name, key)
 
 
 def _normalize_allowed_budget_users(users: str) -> str:
@@ -19,9 +19,10 @@ from __future__ import annotations
 import logging
 import os
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, Dict, Optional
 
 import boto3
+from botocore.config import Config
 try:
     from botocore.exceptions import BotoCoreError, ClientError
 except ImportError:  # pragma: no cover - compatibility for older botocore builds
@@ -33,6 +34,15 @@ logger = logging.getLogger(__name__)
 
 _DEFAULT_REGION = "us-east-1"
 
+# Shared by every cached client: preflight fans out describe/list calls across
+# several services, so back off client-side on throttling and keep sockets warm.
+# Adaptive mode alone defaults to 3 attempts (legacy allowed 5); IAM and
+# Service Quotas throttle hard, so allow as many as the inventory script does.
+_DEFAULT_CLIENT_CONFIG = Config(
+    retries={"mode": "adaptive", "max_attempts": 10},
+    tcp_keepalive=True,
+)
+
 
 # ---------------------------------------------------------------------------
 # Region / AZ helpers
@@ -109,6 +119,7 @@ class AWSContext:
     caller_arn: str = ""
     iam_username: str = ""
     _session: Any = field(default=None, repr=False, compare=False)
+    _clients: Dict[str, Any] = field(default_factory=dict, repr=False, compare=False)
 
     # -- factory ----------------------------------------------------------
 
@@ -164,8 +175,21 @@ class AWSContext:
         return self._session
 
     def client(self, service: str, **kwargs: Any) -> Any:
-        """Create a boto3 client for *service*."""
-        return self.session.client(service, **kwargs)
+        """Return a boto3 client for *service*.
+
+        Clients requested without extra arguments are cached per service so
+        repeated lookups reuse one connection pool, and use adaptive retries
+        with TCP keep-alive. Any *kwargs* (``config``, ``region_name``, ...)
+        build a fresh client exactly as requested.
+        """
+        if kwargs:
+            return self.session.client(service, **kwargs)
+        cached = self._clients.get(service)
+        if cached is None:
+            cached = self._clients[service] = self.session.client(
+                service, config=_DEFAULT_CLIENT_CONFIG
+            )
+        return cached
 
 
 # ---------------------------------------------------------------------------
@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
-
-import yaml
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from daylily_ec.resources import resource_path
+from daylily_ec.util.yaml_loader import safe_load
 
 DEFAULT_MONITORED_REGIONS: tuple[str, ...] = ("us-west-2", "us-east-1", "eu-central-1")
 DEFAULT_PRODUCTION_PARTITIONS: tuple[str, ...] = (
@@ -43,7 +43,7 @@ def resolve_cluster_config_path(cluster_config_path: Optional[str] = None) -> Pa
 
 def _load_cluster_config(cluster_config_path: Optional[str] = None) -> Dict[str, Any]:
     path = resolve_cluster_config_path(cluster_config_path)
-    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    data = safe_load(path.read_text(encoding="utf-8")) or {}
     if not isinstance(data, dict):
         raise ValueError(f"Cluster config must be a mapping: {path}")
     return data
@@ -190,6 +190,52 @@ class PricingSnapshot:
         }
 
 
+def _collect_region_points(
+    ec2_client: Any,
+    *,
+    region: str,
+    partitions: Sequence[str],
+    partition_instances: Dict[str, List[str]],
+    all_instance_types: Sequence[str],
+    captured_at: str,
+) -> List[PricingPoint]:
+    zones = _get_available_zones(ec2_client)
+    vcpu_counts = _get_vcpu_counts(ec2_client, all_instance_types)
+    # Partitions overlap on instance types; price each (zone, type) once.
+    spot_prices: Dict[Tuple[str, str], Optional[float]] = {}
+    points: List[PricingPoint] = []
+
+    for partition in partitions:
+        for availability_zone in zones:
+            for instance_type in partition_instances[partition]:
+                vcpu_count = vcpu_counts.get(instance_type)
+                if not vcpu_count:
+                    continue
+                price_key = (availability_zone, instance_type)
+                if price_key not in spot_prices:
+                    spot_prices[price_key] = _get_current_spot_price(
+                        ec2_client,
+                        instance_type=instance_type,
+                        availability_zone=availability_zone,
+                    )
+                spot_price = spot_prices[price_key]
+                if spot_price is None:
+                    continue
+                points.append(
+                    PricingPoint(
+                        captured_at=captured_at,
+                        region=region,
+                        availability_zone=availability_zone,
+                        partition=partition,
+                        instance_type=instance_type,
+                        vcpu_count=vcpu_count,
+                        hourly_spot_price=spot_price,
+                        vcpu_cost_per_hour=round(spot_price / vcpu_count, 8),
+                    )
+                )
+    return points
+
+
 def collect_pricing_snapshot(
     *,
     regions: Optional[Sequence[str]] = None,
@@ -217,39 +263,30 @@ def collect_pricing_snapshot(
 
     session_builder = session_factory or _build_session
     session = session_builder(profile)
-    snapshot_points: List[PricingPoint] = []
     timestamp = captured_at or _now_iso()
 
-    for region in selected_regions:
-        ec2_client = session.client("ec2", region_name=region)
-        zones = _get_available_zones(ec2_client)
-        vcpu_counts = _get_vcpu_counts(ec2_client, all_instance_types)
-
-        for partition in selected_partitions:
-            for availability_zone in zones:
-                for instance_type in partition_instances[partition]:
-                    vcpu_count = vcpu_counts.get(instance_type)
-                    if not vcpu_count:
-                        continue
-                    spot_price = _get_current_spot_price(
-                        ec2_client,
-                        instance_type=instance_type,
-                        availability_zone=availability_zone,
-                    )
-                    if spot_price is None:
-                        continue
-                    snapshot_points.append(
-                        PricingPoint(
-                            captured_at=timestamp,
-                            region=region,
-                            availability_zone=availability_zone,
-                            partition=partition,
-                            instance_type=instance_type,
-                            vcpu_count=vcpu_count,
-                            hourly_spot_price=spot_price,
-                            vcpu_cost_per_hour=round(spot_price / vcpu_count, 8),
-                        )
-                    )
+    # Clients are built up front on this thread; each region is then
+    # queried concurrently since the per-region calls are independent.
+    region_clients = [
+        (region, session.client("ec2", region_name=region)) for region in selected_regions
+    ]
+    snapshot_points: List[PricingPoint] = []
+    if region_clients:
+        with ThreadPoolExecutor(max_workers=len(region_clients)) as executor:
+            futures = [
+                executor.submit(
+                    _collect_region_points,
+                    ec2_client,
+                    region=region,
+                    partitions=selected_partitions,
+                    partition_instances=partition_instances,
+                    all_instance_types=all_instance_types,
+                    captured_at=timestamp,
+                )
+                for region, ec2_client in region_clients
+            ]
+            for future in futures:
+                snapshot_points.extend(future.result())
 
     snapshot_points.sort(
         key=lambda point: (
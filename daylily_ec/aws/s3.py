@@ -22,6 +22,7 @@ Public API
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, List, Optional
 
 import boto3
@@ -35,10 +36,24 @@ logger = logging.getLogger(__name__)
 
 BUCKET_NAME_FILTER = "omics-analysis"
 
+# Upper bound on concurrent ``GetBucketLocation`` calls during discovery.
+_BUCKET_LOCATION_WORKERS = 8
+
+_S3_MAX_POOL_CONNECTIONS = 16
+
 
 def _standard_s3_config() -> Config:
-    """Return an S3 client config suitable for bucket metadata reads."""
-    return Config(s3={"use_accelerate_endpoint": False})
+    """Return an S3 client config suitable for bucket metadata reads.
+
+    The pool is sized above the concurrent discovery/verification fan-out so
+    worker threads never wait on a connection, and keep-alive lets them reuse
+    warm TLS sessions.
+    """
+    return Config(
+        s3={"use_accelerate_endpoint": False},
+        max_pool_connections=_S3_MAX_POOL_CONNECTIONS,
+        tcp_keepalive=True,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -79,14 +94,16 @@ def list_candidate_buckets(
         logger.error("Failed to list S3 buckets: %s", exc)
         return []
 
-    candidates: List[str] = []
-    for name in all_buckets:
-        if BUCKET_NAME_FILTER not in name:
-            continue
-        bucket_region = _resolve_bucket_region(s3, name)
-        if bucket_region == region:
-            candidates.append(name)
+    named = [name for name in all_buckets if BUCKET_NAME_FILTER in name]
+    if not named:
+        return []
+
+    # Each region lookup is an independent round-trip; resolve them concurrently.
+    workers = min(_BUCKET_LOCATION_WORKERS, len(named))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        regions = list(executor.map(lambda name: _resolve_bucket_region(s3, name), named))
 
+    candidates = [name for name, bucket_region in zip(named, regions) if bucket_region == region]
     return sorted(candidates)
 
 
@@ -211,9 +228,20 @@ def verify_reference_bundle(
             logger.error("Reference verification failed: bucket %s does not exist.", bucket_name)
             return False
 
+        # The version read and prefix probes are independent round-trips.
+        with ThreadPoolExecutor(max_workers=len(REQUIRED_REFERENCE_PREFIXES) + 1) as executor:
+            version_future = executor.submit(
+                _read_reference_bucket_version, s3_client, bucket_name
+            )
+            prefix_futures = [
+                (prefix, executor.submit(_reference_prefix_exists, s3_client, bucket_name, prefix))
+                for prefix in REQUIRED_REFERENCE_PREFIXES
+            ]
+            bucket_version = version_future.result()
+            prefix_present = [(prefix, future.result()) for prefix, future in prefix_futures]
+
         issues: List[str] = []
 
-        bucket_version = _read_reference_bucket_version(s3_client, bucket_name)
         if bucket_version is None:
             issues.append("missing version marker")
         elif bucket_version != DEFAULT_REFERENCE_VERSION:
@@ -222,8 +250,8 @@ def verify_reference_bundle(
                 f"(expected {DEFAULT_REFERENCE_VERSION}, found {bucket_version})"
             )
 
-        for prefix in REQUIRED_REFERENCE_PREFIXES:
-            if not _reference_prefix_exists(s3_client, bucket_name, prefix):
+        for prefix, present in prefix_present:
+            if not present:
                 issues.append(f"missing objects under {prefix}")
 
         if issues:
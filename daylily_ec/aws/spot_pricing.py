@@ -75,6 +75,8 @@ def calculate_queue_spot_price(
     queue_config: Dict[str, Any],
     az: str,
     bump_price: float = DEFAULT_BUMP_PRICE,
+    *,
+    price_cache: Optional[Dict[str, float]] = None,
 ) -> Optional[float]:
     """Return the bumped median spot price for all instances in a queue.
 
@@ -82,6 +84,10 @@ def calculate_queue_spot_price(
     looks up the current spot price, then returns
     ``round(median + bump_price, 4)``.
 
+    When *price_cache* is given, prices already looked up for *az* are
+    reused instead of calling ``describe_spot_price_history`` again; new
+    lookups are stored back into it.
+
     Returns ``None`` if no prices could be collected.
     """
     all_prices: List[float] = []
@@ -89,7 +95,12 @@ def calculate_queue_spot_price(
         for inst in resource.get("Instances", []):
             itype = inst.get("InstanceType")
             if itype:
-                price = get_spot_price(ec2_client, itype, az)
+                if price_cache is not None and itype in price_cache:
+                    price = price_cache[itype]
+                else:
+                    price = get_spot_price(ec2_client, itype, az)
+                    if price_cache is not None:
+                        price_cache[itype] = price
                 all_prices.append(price)
 
     if not all_prices:
@@ -103,13 +114,17 @@ def apply_spot_to_queue(
     queue_config: Dict[str, Any],
     az: str,
     bump_price: float = DEFAULT_BUMP_PRICE,
+    *,
+    price_cache: Optional[Dict[str, float]] = None,
 ) -> None:
     """Set ``SpotPrice`` on every ComputeResource in *queue_config* (in-place).
 
     Adds a YAML end-of-line comment when the config is a
     :class:`~ruamel.yaml.comments.CommentedMap`.
     """
-    spot = calculate_queue_spot_price(ec2_client, queue_config, az, bump_price)
+    spot = calculate_queue_spot_price(
+        ec2_client, queue_config, az, bump_price, price_cache=price_cache
+    )
     if spot is None:
         return
 
@@ -129,11 +144,15 @@ def process_slurm_queues(
     ec2_client: Any,
     bump_price: float = DEFAULT_BUMP_PRICE,
 ) -> None:
-    """Process **all** Slurm queues in *config* to add SpotPrice values (in-place)."""
+    """Process **all** Slurm queues in *config* to add SpotPrice values (in-place).
+
+    Instance types shared between queues are looked up once per call.
+    """
+    price_cache: Dict[str, float] = {}
     for queue in config.get("Scheduling", {}).get("SlurmQueues", []):
         if not isinstance(queue, CommentedMap):
             queue = CommentedMap(queue)
-        apply_spot_to_queue(ec2_client, queue, az, bump_price)
+        apply_spot_to_queue(ec2_client, queue, az, bump_price, price_cache=price_cache)
 
 
 # ── top-level convenience ────────────────────────────────────────────
@@ -22,6 +22,9 @@ logger = logging.getLogger(__name__)
 
 PENDING_STATUSES = {"Pending", "InProgress", "Delayed"}
 SUCCESS_STATUS = "Success"
+# Most Run Command payloads finish within a second or two; start polling
+# quickly and double the wait up to the caller's ``poll_interval``.
+INITIAL_POLL_DELAY = 0.5
 SUPPORTED_REMOTE_USER = "ubuntu"
 SUPPORTED_SESSION_HOME = f"/home/{SUPPORTED_REMOTE_USER}"
 SUPPORTED_SESSION_SHELL_PROFILE = (
@@ -231,14 +234,16 @@ def _ubuntu_payload_guard() -> str:
     )
 
 
+_PAYLOAD_WRITER_COMMAND = "python3 -c " + shlex.quote(
+    "import base64, os, pathlib; "
+    "path = pathlib.Path(os.environ['DAYLILY_SSM_TMP']); "
+    "path.write_text(base64.b64decode(os.environ['DAYLILY_SSM_B64']).decode('utf-8'), encoding='utf-8')"
+)
+
+
 def _encode_script_payload(script: str, *, as_user: Optional[str]) -> str:
     user = _require_ubuntu_user(as_user)
     encoded = base64.b64encode(script.encode("utf-8")).decode("ascii")
-    writer = (
-        "import base64, os, pathlib; "
-        "path = pathlib.Path(os.environ['DAYLILY_SSM_TMP']); "
-        "path.write_text(base64.b64decode(os.environ['DAYLILY_SSM_B64']).decode('utf-8'), encoding='utf-8')"
-    )
     runner = f'sudo -iu {shlex.quote(user)} bash -l "$tmp"'
     return "\n".join(
         [
@@ -248,7 +253,7 @@ def _encode_script_payload(script: str, *, as_user: Optional[str]) -> str:
             "tmp=$(mktemp /tmp/daylily-ssm-XXXXXX.sh)",
             f"export DAYLILY_SSM_B64={shlex.quote(encoded)}",
             'export DAYLILY_SSM_TMP="$tmp"',
-            f"python3 -c {shlex.quote(writer)}",
+            _PAYLOAD_WRITER_COMMAND,
             f'chown {shlex.quote(user)} "$tmp"',
             'chmod 700 "$tmp"',
             "set +e",
@@ -297,6 +302,7 @@ def run_shell(
 
     command_id = str(response["Command"]["CommandId"])
     deadline = None if timeout is None else time.time() + timeout
+    delay = min(INITIAL_POLL_DELAY, poll_interval)
 
     while True:
         try:
@@ -307,7 +313,8 @@ def run_shell(
         except client.exceptions.InvocationDoesNotExist:
             if deadline is not None and time.time() >= deadline:
                 raise TimeoutError(f"SSM command '{command_id}' did not start within {timeout}s.")
-            time.sleep(poll_interval)
+            time.sleep(delay)
+            delay = min(delay * 2, poll_interval)
             continue
         except (BotoCoreError, ClientError) as exc:
             raise SsmError(f"Unable to fetch SSM command invocation '{command_id}': {exc}") from exc
@@ -318,7 +325,8 @@ def run_shell(
                 raise TimeoutError(
                     f"SSM command '{command_id}' did not complete within {timeout}s."
                 )
-            time.sleep(poll_interval)
+            time.sleep(delay)
+            delay = min(delay * 2, poll_interval)
             continue
 
         result = SsmCommandResult(
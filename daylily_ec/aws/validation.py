@@ -10,7 +10,6 @@ from pathlib import Path
 from typing import Any, Callable, Iterable, Literal, Optional
 
 from pydantic import Field
-import yaml
 
 from daylily_ec.aws.cloudformation import derive_stack_name, describe_stack_status
 from daylily_ec.aws.context import AWSContext, parse_region_az
@@ -27,6 +26,7 @@ from daylily_ec.config.triplets import get_effective_default, load_config, resol
 from daylily_ec.render.renderer import ALL_SUBSTITUTION_KEYS, render_template
 from daylily_ec.resources import resource_path
 from daylily_ec.state.models import CheckResult, CheckStatus, PreflightReport
+from daylily_ec.util.yaml_loader import safe_load
 from daylily_ec.workflow.create_cluster import (
     EXIT_SUCCESS,
     EXIT_VALIDATION_FAILURE,
@@ -559,7 +559,7 @@ def extract_cluster_shape(
 ) -> ClusterShape:
     """Parse rendered ParallelCluster YAML and compute demand."""
 
-    payload = yaml.safe_load(rendered_yaml) or {}
+    payload = safe_load(rendered_yaml) or {}
     if not isinstance(payload, dict):
         raise ValueError("Rendered cluster template is not a YAML mapping.")
 
@@ -26,6 +26,7 @@ from daylily_ec.config.models import (
     REQUIRED_CONFIG_KEYS,
     Triplet,
 )
+from daylily_ec.util.yaml_loader import safe_load
 
 
 # ---------------------------------------------------------------------------
@@ -44,7 +45,7 @@ def load_config(path: str | Path) -> ConfigFile:
     raw: Dict[str, Any] = {}
     if path.exists():
         with open(path, encoding="utf-8") as fh:
-            raw = yaml.safe_load(fh) or {}
+            raw = safe_load(fh) or {}
 
     ec_raw = raw.get("ephemeral_cluster", {}) or {}
     config_raw = ec_raw.get("config", {}) or {}
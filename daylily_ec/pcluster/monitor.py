@@ -14,6 +14,8 @@ import time
 from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
+from daylily_ec import ui
+
 logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
@@ -182,8 +184,6 @@ def wait_for_creation(
         status = get_cluster_status(cluster_name, region, profile=profile)
 
         if status == STATUS_COMPLETE:
-            from daylily_ec import ui  # local import to avoid circular deps
-
             ui.clear_progress()
             # Fetch head node details for the success banner.
             details = get_cluster_details(
@@ -208,8 +208,6 @@ def wait_for_creation(
                 cluster_name,
                 elapsed,
             )
-            from daylily_ec import ui  # local import to avoid circular deps
-
             ui.progress_line(f"Cluster creating ... {ui.elapsed_str(elapsed)}")
             sleep(poll_interval)
             continue
@@ -257,8 +255,6 @@ def wait_for_deletion(
         status = get_cluster_status(cluster_name, region, profile=profile)
 
         if status is None:
-            from daylily_ec import ui  # local import to avoid circular deps
-
             ui.clear_progress()
             return MonitorResult(
                 final_status=None,
@@ -274,8 +270,6 @@ def wait_for_deletion(
                 error="Cluster deletion failed.",
             )
 
-        from daylily_ec import ui  # local import to avoid circular deps
-
         elapsed = time.time() - start
         ui.progress_line(f"Cluster deleting ... status: {status} ({ui.elapsed_str(elapsed)})")
         sleep(poll_interval)
@@ -169,8 +169,9 @@ def write_init_artifacts(
     yaml_init = out_dir / f"{cluster_name}_cluster_{timestamp}.yaml.init"
     init_template = out_dir / f"{cluster_name}_init_template_{timestamp}.yaml"
 
-    # 1. Raw template copy
-    shutil.copy2(str(src), str(yaml_init))
+    # 1. Raw template copy (contents only; the packaged template's mode and
+    #    timestamps are irrelevant to a per-run artifact)
+    shutil.copyfile(str(src), str(yaml_init))
 
     # 2. Rendered init template
     template_text = src.read_text(encoding="utf-8")
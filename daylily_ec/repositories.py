@@ -5,10 +5,10 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Sequence
 
-import yaml
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
 from daylily_ec.resources import resource_path
+from daylily_ec.util.yaml_loader import safe_load
 
 
 CATALOG_VERSION = 2
@@ -467,7 +467,7 @@ def _migrate_v1_analysis_commands(raw: Dict[str, Any]) -> Dict[str, Any]:
 
 def load_repository_catalog(path: Optional[Path] = None) -> RepositoryCatalog:
     catalog_path = Path(path).expanduser() if path is not None else default_catalog_path()
-    raw = yaml.safe_load(catalog_path.read_text(encoding="utf-8"))
+    raw = safe_load(catalog_path.read_text(encoding="utf-8"))
     if not isinstance(raw, dict):
         raise ValueError(f"Repository catalog must be a YAML mapping: {catalog_path}")
     if "command_catalog_version" not in raw:
@@ -19,6 +19,7 @@ from botocore.exceptions import BotoCoreError, ClientError
 from daylily_ec.state.store import config_dir
 
 MOUNT_ID_RE = re.compile(r"^[A-Za-z0-9._-]+$")
+STATE_COMPONENT_RE = re.compile(r"[A-Za-z0-9._:-]+")
 MAX_MOUNT_ID_LENGTH = 128
 FSX_RUN_MOUNT_ROOT = "/run_dir_mounts/"
 HEADNODE_RUN_MOUNT_ROOT = "/fsx/run_dir_mounts/"
@@ -26,6 +27,7 @@ DEFAULT_AUTO_IMPORT_EVENTS = ("NEW", "CHANGED")
 ALL_AUTO_IMPORT_EVENTS = ("NEW", "CHANGED", "DELETED")
 TERMINAL_FAILURE_LIFECYCLES = {"FAILED", "MISCONFIGURED"}
 INACTIVE_LIFECYCLES = {"DELETED", "DELETING", "DELETE_IN_PROGRESS", "FAILED"}
+SUPPORTED_PLATFORMS = {"ILMN", "ONT", "ULTIMA", "PACBIO", "OTHER"}
 RUN_MOUNT_PURPOSE_TAG = "run-dir-mount"
 STATE_SCHEMA_VERSION = 1
 LOCAL_PROJECTION_CREATED = "created"
@@ -968,11 +970,10 @@ def _parse_event_tokens(raw: str, *, default: Sequence[str]) -> List[str]:
     if lowered == "all":
         return list(ALL_AUTO_IMPORT_EVENTS)
     result: List[str] = []
-    aliases = {"new": "NEW", "changed": "CHANGED", "deleted": "DELETED"}
     for token in re.split(r"[, ]+", text):
         if not token:
             continue
-        normalized = aliases.get(token.lower(), token.upper())
+        normalized = token.upper()
         if normalized not in ALL_AUTO_IMPORT_EVENTS:
             raise RunMountError(f"Unsupported FSx S3 event type: {token!r}.")
         if normalized not in result:
@@ -1050,10 +1051,10 @@ def _with_trailing_slash(value: str) -> str:
 
 def _normalize_platform(platform: Optional[str]) -> str:
     value = str(platform or "OTHER").strip().upper()
-    allowed = {"ILMN", "ONT", "ULTIMA", "PACBIO", "OTHER"}
-    if value not in allowed:
+    if value not in SUPPORTED_PLATFORMS:
         raise RunMountError(
-            f"Unsupported platform {platform!r}; expected one of {', '.join(sorted(allowed))}."
+            f"Unsupported platform {platform!r}; "
+            f"expected one of {', '.join(sorted(SUPPORTED_PLATFORMS))}."
         )
     return value
 
@@ -1065,7 +1066,7 @@ def _require_region(region: str) -> None:
 
 def _state_component(value: str) -> str:
     component = str(value or "").strip()
-    if not component or not re.fullmatch(r"[A-Za-z0-9._:-]+", component):
+    if not component or not STATE_COMPONENT_RE.fullmatch(component):
         raise RunMountError(f"Unsafe state path component: {value!r}.")
     return component
 
@@ -1208,16 +1209,20 @@ def _run_headnode_shell(
     )
 
 
-def _verification_script(headnode_path: str, platform: str) -> str:
-    path = shlex.quote(headnode_path)
-    _ = platform
-    python_code = "\n".join(
+_VERIFY_PYTHON_COMMAND = "python3 -c " + shlex.quote(
+    "\n".join(
         [
             "import json, os, pathlib",
             "root = pathlib.Path(os.environ['DAYLILY_VERIFY_ROOT'])",
             "print(json.dumps({'path': str(root), 'usable': True}, sort_keys=True))",
         ]
     )
+)
+
+
+def _verification_script(headnode_path: str, platform: str) -> str:
+    path = shlex.quote(headnode_path)
+    _ = platform
     return "\n".join(
         [
             "set -euo pipefail",
@@ -1228,7 +1233,7 @@ def _verification_script(headnode_path: str, platform: str) -> str:
             'cd "$root"',
             'ls -A . >/dev/null',
             f"export DAYLILY_VERIFY_ROOT={path}",
-            f"python3 -c {shlex.quote(python_code)}",
+            _VERIFY_PYTHON_COMMAND,
         ]
     )
 
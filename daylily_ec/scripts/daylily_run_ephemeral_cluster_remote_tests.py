@@ -7,8 +7,6 @@ import os
 import sys
 from pathlib import Path
 
-import yaml
-
 from daylily_ec.aws.ssm import (
     resolve_headnode_instance_id,
     run_shell,
@@ -16,11 +14,12 @@ from daylily_ec.aws.ssm import (
 )
 from daylily_ec.resources import resource_path
 from daylily_ec.scripts.common import CommandError, need_cmd, resolve_cluster, resolve_region
+from daylily_ec.util.yaml_loader import safe_load
 
 
 def _load_default_repo() -> tuple[str, str]:
     cfg_path = resource_path("config/daylily_available_repositories.yaml")
-    cfg = yaml.safe_load(Path(cfg_path).read_text(encoding="utf-8")) or {}
+    cfg = safe_load(Path(cfg_path).read_text(encoding="utf-8")) or {}
     repo_key = cfg.get("default_repository") or "daylily-omics-analysis"
     repo = (cfg.get("repositories") or {}).get(repo_key) or {}
     return str(repo.get("https_url") or ""), str(repo.get("default_ref") or "main")
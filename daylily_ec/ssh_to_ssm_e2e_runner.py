@@ -26,6 +26,7 @@ from daylily_ec.aws.ssm import (
     wait_for_ssm_online,
 )
 from daylily_ec.scripts.common import CommandError, aws_env, need_cmd, run_command
+from daylily_ec.util.yaml_loader import safe_load
 
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
@@ -260,7 +261,7 @@ def _set_triplet_value(raw_cfg: dict, key: str, value: str) -> None:
 def write_runner_config(base_config_path: Path, cluster_name: str, dest_dir: Path) -> Path:
     if not base_config_path.is_file():
         raise CommandError(f"Config file not found: {base_config_path}")
-    raw_cfg = yaml.safe_load(base_config_path.read_text(encoding="utf-8")) or {}
+    raw_cfg = safe_load(base_config_path.read_text(encoding="utf-8")) or {}
     _set_triplet_value(raw_cfg, "cluster_name", cluster_name)
     dest_dir.mkdir(parents=True, exist_ok=True)
     dest_path = dest_dir / f"{cluster_name}_runner_config.yaml"
@@ -662,7 +663,7 @@ def _validate_export_artifact(
 
     if not export_yaml.is_file():
         raise CommandError(f"Export did not write expected artifact: {export_yaml}")
-    payload = yaml.safe_load(export_yaml.read_text(encoding="utf-8")) or {}
+    payload = safe_load(export_yaml.read_text(encoding="utf-8")) or {}
     export_payload = payload.get("fsx_export") or {}
     status = str(export_payload.get("status") or "")
     if status != "success":
@@ -16,8 +16,10 @@ import shutil
 import subprocess
 import sys
 import tempfile
+import threading
 import uuid
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path, PurePosixPath
 from typing import Dict, List, Mapping, Optional, Sequence, Tuple
@@ -90,6 +92,8 @@ BWA_KMER = "BWA_KMER"
 DEEP_MODEL = "DEEP_MODEL"
 
 S3_MULTIPART_MIN_PART_SIZE = 5 * 1024 * 1024
+S3_DELETE_BATCH_SIZE = 1000
+RUN_METRIC_COPY_WORKERS = 8
 MOUNT_PATH_ROOTS = ("/fsx/run_dir_mounts", "/run_dir_mounts")
 MOUNT_ID_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9_.-]*$")
 ONT_FASTQ_SHARD_RE = re.compile(
@@ -497,7 +501,7 @@ def normalise_stage_target(stage_target: str) -> str:
 
 def build_stage_paths(stage_target: str, bucket_uri: str) -> StagePaths:
     stage_target = normalise_stage_target(stage_target)
-    timestamp = dt.datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
+    timestamp = dt.datetime.now(dt.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
     remote_stage_name = f"remote_stage_{timestamp}"
     remote_fsx_stage = f"{stage_target}/{remote_stage_name}"
 
@@ -656,8 +660,20 @@ def aws_command_binary_to_handle(
             stderr=subprocess.PIPE,
         ) as proc:
             assert proc.stdout is not None
+            assert proc.stderr is not None
+            stderr_stream = proc.stderr
+            # Drain stderr alongside the stdout copy; a CLI that logs more than
+            # a pipe buffer of retries/warnings would otherwise stall mid-stream.
+            stderr_chunks: List[bytes] = []
+            stderr_pump = threading.Thread(
+                target=lambda: stderr_chunks.append(stderr_stream.read()),
+                daemon=True,
+            )
+            stderr_pump.start()
             shutil.copyfileobj(proc.stdout, handle)
-            _stdout, stderr = proc.communicate()
+            proc.wait()
+            stderr_pump.join()
+            stderr = b"".join(stderr_chunks)
             if proc.returncode != 0:
                 message = f"Command failed ({proc.returncode}): {' '.join(command)}"
                 if stderr:
@@ -681,9 +697,23 @@ def check_s3_path(
     aws_env: Dict[str, str],
     debug: bool,
 ) -> None:
-    args = ["s3", "ls", uri]
+    # Existence only needs one key; ``s3 ls`` would page through the whole prefix.
+    bucket, key = parse_s3_uri(uri)
+    args = [
+        "s3api",
+        "list-objects-v2",
+        "--bucket",
+        bucket,
+        "--prefix",
+        key,
+        "--max-items",
+        "1",
+        "--page-size",
+        "1",
+    ]
     result = aws_command(args, aws_env=aws_env, debug=debug, capture_output=True)
-    if not result.stdout.strip():
+    payload = json.loads(result.stdout or "{}")
+    if not payload.get("Contents"):
         raise CommandError(f"S3 object or prefix not accessible: {uri}")
 
 
@@ -1053,19 +1083,53 @@ def aws_copy(
     aws_env: Dict[str, str],
     debug: bool,
     recursive: bool = False,
+    only_show_errors: bool = False,
 ) -> None:
     args = ["s3", "cp", source, destination]
     if recursive:
         args.append("--recursive")
+    if only_show_errors:
+        args.append("--only-show-errors")
     aws_command(args, aws_env=aws_env, debug=debug)
 
 
 def cleanup_s3_objects(uris: Sequence[str], *, aws_env: Dict[str, str], debug: bool) -> None:
+    # One DeleteObjects call per bucket and 1000 keys instead of one ``s3 rm`` per URI.
+    keys_by_bucket: Dict[str, List[str]] = {}
     for uri in uris:
         try:
-            aws_command(["s3", "rm", uri], aws_env=aws_env, debug=debug)
+            bucket, key = parse_s3_uri(uri)
         except CommandError:
-            pass
+            continue
+        if key:
+            keys_by_bucket.setdefault(bucket, []).append(key)
+    for bucket, keys in keys_by_bucket.items():
+        for start in range(0, len(keys), S3_DELETE_BATCH_SIZE):
+            batch = keys[start : start + S3_DELETE_BATCH_SIZE]
+            delete_spec = {"Objects": [{"Key": key} for key in batch], "Quiet": True}
+            # A full batch of staged keys exceeds the 128 KiB per-argument
+            # limit, so hand the spec to the CLI as a file. Cleanup runs from
+            # finally/except blocks and must never replace the real outcome.
+            try:
+                with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as handle:
+                    json.dump(delete_spec, handle)
+                try:
+                    aws_command(
+                        [
+                            "s3api",
+                            "delete-objects",
+                            "--bucket",
+                            bucket,
+                            "--delete",
+                            f"file://{handle.name}",
+                        ],
+                        aws_env=aws_env,
+                        debug=debug,
+                    )
+                finally:
+                    os.unlink(handle.name)
+            except (CommandError, OSError):
+                pass
 
 
 def source_copy_reference(source: str, *, reference_bucket: str) -> str:
@@ -1796,8 +1860,7 @@ def stage_run_metrics(
     aws_env: Dict[str, str],
     debug: bool,
 ) -> List[str]:
-    created: List[str] = []
-    for metric_file in files:
+    def copy_metric_file(metric_file: RunMetricFile) -> str:
         remote_fsx = (
             f"{stage.remote_fsx_stage}/runs/{metric_file.spec.run_uid}/"
             f"{metric_file.destination_relative_path}"
@@ -1811,9 +1874,15 @@ def stage_run_metrics(
             remote_s3,
             aws_env=aws_env,
             debug=debug,
+            only_show_errors=True,
         )
-        created.append(remote_fsx)
-    return created
+        return remote_fsx
+
+    # Run metric folders hold many small files; copy them concurrently rather
+    # than paying one ``aws s3 cp`` start-up and round-trip per file in turn.
+    # Concurrent copies suppress CLI progress lines so they cannot interleave.
+    with ThreadPoolExecutor(max_workers=RUN_METRIC_COPY_WORKERS) as executor:
+        return list(executor.map(copy_metric_file, files))
 
 
 def reject_duplicate_multi_lane_sources(
@@ -2736,6 +2805,26 @@ def precheck_manifest(
     rows_checked = 0
     source_objects_checked = 0
     concordance_dirs_checked = 0
+    # Manifests repeat the same concordance directory and reference inputs
+    # across samples; probe each distinct path once and replay its outcome.
+    source_check_errors: Dict[Tuple[str, bool], Optional[str]] = {}
+
+    def source_check_error(path: str, *, allow_directory: bool = False) -> Optional[str]:
+        cache_key = (path, allow_directory)
+        if cache_key not in source_check_errors:
+            try:
+                check_source_path(
+                    path,
+                    reference_bucket=reference_bucket,
+                    aws_env=aws_env,
+                    debug=debug,
+                    allow_directory=allow_directory,
+                )
+            except CommandError as exc:
+                source_check_errors[cache_key] = str(exc)
+            else:
+                source_check_errors[cache_key] = None
+        return source_check_errors[cache_key]
 
     with analysis_samples.open(newline="") as ff:
         reader = csv.DictReader(ff, delimiter="\t")
@@ -2814,21 +2903,15 @@ def precheck_manifest(
 
             for field, path in _source_checks_for_precheck(normalized):
                 source_objects_checked += 1
-                try:
-                    check_source_path(
-                        path,
-                        reference_bucket=reference_bucket,
-                        aws_env=aws_env,
-                        debug=debug,
-                    )
-                except CommandError as exc:
+                error = source_check_error(path)
+                if error is not None:
                     issues.append(
                         _row_issue(
                             normalized,
                             row_number=row_number,
                             field=field,
                             path=path,
-                            message=str(exc),
+                            message=error,
                         )
                     )
 
@@ -2868,15 +2951,8 @@ def precheck_manifest(
             concordance_accessible = True
             if is_populated_path(concordance_source):
                 concordance_dirs_checked += 1
-                try:
-                    check_source_path(
-                        concordance_source,
-                        reference_bucket=reference_bucket,
-                        aws_env=aws_env,
-                        debug=debug,
-                        allow_directory=True,
-                    )
-                except CommandError as exc:
+                error = source_check_error(concordance_source, allow_directory=True)
+                if error is not None:
                     concordance_accessible = False
                     issues.append(
                         _row_issue(
@@ -2884,7 +2960,7 @@ def precheck_manifest(
                             row_number=row_number,
                             field=concordance_field,
                             path=concordance_source,
-                            message=str(exc),
+                            message=error,
                         )
                     )
             if concordance_accessible and is_populated_path(concordance_source):
@@ -1,2 +1 @@
-"""Shared utilities (yq detection, shell helpers)."""
-
+"""Shared utilities (yq detection, shell helpers, YAML loading)."""
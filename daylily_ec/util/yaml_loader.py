@@ -0,0 +1,17 @@
+"""YAML loading backed by libyaml when PyYAML was built with it."""
+
+from __future__ import annotations
+
+from typing import IO, Any, Union
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+
+def safe_load(stream: Union[str, bytes, IO[str], IO[bytes]]) -> Any:
+    """Parse *stream* like :func:`yaml.safe_load`, using the C loader if present."""
+    return yaml.load(stream, Loader=SafeLoader)
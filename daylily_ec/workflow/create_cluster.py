@@ -1413,6 +1413,7 @@ def configure_headnode(
 
     from daylily_ec.aws.ssm import SsmCommandFailedError, run_shell, write_remote_text
     from daylily_ec.resources import resource_path
+    from daylily_ec.util.yaml_loader import safe_load
 
     user_cfg_path = Path.home() / ".config" / "daylily" / "daylily_cli_global.yaml"
     cfg_path = (
@@ -1426,7 +1427,7 @@ def configure_headnode(
     )
 
     with open(cfg_path, encoding="utf-8") as fh:
-        cli_cfg = yaml.safe_load(fh) or {}
+        cli_cfg = safe_load(fh) or {}
 
     daylily = cli_cfg.get("daylily", {}) or {}
     repo_ref = daylily.get("git_ephemeral_cluster_repo_tag", "main")
@@ -1511,7 +1512,7 @@ def configure_headnode(
         )
         if avail_repos_path.exists():
             with open(avail_repos_path, encoding="utf-8") as fh:
-                repos_cfg = yaml.safe_load(fh) or {}
+                repos_cfg = safe_load(fh) or {}
 
             for repo_key, git_ref in repo_overrides.items():
                 if repo_key in repos_cfg.get("repositories", {}):
@@ -218,11 +218,9 @@ def run_delete_workflow(options: DeleteOptions) -> int:
         )
         return 1
 
-    fsx_ids = find_fsx_associations(session.client("fsx"), resolved.cluster_name)
-    repository_activity = find_active_fsx_repository_activity(
-        session.client("fsx"),
-        fsx_ids,
-    )
+    fsx_client = session.client("fsx")
+    fsx_ids = find_fsx_associations(fsx_client, resolved.cluster_name)
+    repository_activity = find_active_fsx_repository_activity(fsx_client, fsx_ids)
     if repository_activity["associations"] or repository_activity["export_tasks"]:
         ui.warn("Active FSx data repository activity exists on the cluster filesystem:")
         for association in repository_activity["associations"]:
@@ -14,15 +14,18 @@ import json
 import re
 import shlex
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Iterable
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 BUCKET = "lsmc-dayoa-omics-analysis-us-west-2"
+REPO_WORKERS = 8
 EXPORTS = [
     "FSxLustre20260122T043503Z",
     "FSxLustre20260122T112533Z",
@@ -120,7 +123,16 @@ class InventoryRow:
 class S3Inventory:
     def __init__(self, profile: str, region: str) -> None:
         session = boto3.Session(profile_name=profile, region_name=region)
-        self.s3 = session.client("s3")
+        # The inventory issues thousands of list/get calls against one bucket;
+        # adaptive retries back off client-side when S3 starts throttling.
+        # Repos are inventoried concurrently, so the pool must cover every worker.
+        self.s3 = session.client(
+            "s3",
+            config=Config(
+                retries={"mode": "adaptive", "max_attempts": 10},
+                max_pool_connections=REPO_WORKERS,
+            ),
+        )
         self.profile = profile
         self.region = region
 
@@ -153,32 +165,36 @@ class S3Inventory:
             count += len(page.get("Contents", []))
         return count
 
-    def object_exists(self, key: str) -> bool:
-        try:
-            self.s3.head_object(Bucket=BUCKET, Key=key)
-        except ClientError as exc:
-            code = exc.response.get("Error", {}).get("Code")
-            if code in {"404", "NoSuchKey", "NotFound"}:
-                return False
-            raise
-        return True
+    def list_child_names(self, prefix: str) -> set[str]:
+        paginator = self.s3.get_paginator("list_objects_v2")
+        names: set[str] = set()
+        for page in paginator.paginate(Bucket=BUCKET, Prefix=prefix, Delimiter="/"):
+            for item in page.get("Contents", []):
+                key = item.get("Key")
+                if key:
+                    names.add(str(key)[len(prefix) :])
+        return names
 
     def read_text(self, key: str) -> tuple[str | None, str | None]:
+        # A suffix range returns the whole object when it is small enough, so
+        # one GET replaces the HEAD-then-GET pair.
         try:
-            head = self.s3.head_object(Bucket=BUCKET, Key=key)
+            resp = self.s3.get_object(
+                Bucket=BUCKET, Key=key, Range=f"bytes=-{MAX_METADATA_BYTES}"
+            )
         except ClientError as exc:
             code = exc.response.get("Error", {}).get("Code")
             if code in {"404", "NoSuchKey", "NotFound"}:
                 return None, "missing"
+            if code == "InvalidRange":
+                return "", None
             raise
 
-        size = int(head.get("ContentLength") or 0)
-        kwargs: dict[str, Any] = {"Bucket": BUCKET, "Key": key}
+        body = resp["Body"].read()
+        total = str(resp.get("ContentRange") or "").rpartition("/")[2]
         note = None
-        if size > MAX_METADATA_BYTES:
-            kwargs["Range"] = f"bytes={max(size - MAX_METADATA_BYTES, 0)}-{size - 1}"
+        if total.isdigit() and int(total) > MAX_METADATA_BYTES:
             note = f"truncated {key.rsplit('/', 1)[-1]} to last {MAX_METADATA_BYTES} bytes"
-        body = self.s3.get_object(**kwargs)["Body"].read()
         return body.decode("utf-8", errors="replace"), note
 
 
@@ -421,9 +437,17 @@ def inventory_repo(
     hg38_prefixes, hg38_count = hg38_prefixes_and_count(client, repo_prefix)
     row.hg38_result_prefixes = ",".join(f"s3://{BUCKET}/{prefix}" for prefix in hg38_prefixes)
     row.hg38_result_object_count = hg38_count
-    row.has_success_marker = client.object_exists(f"{repo_prefix}daylily.successful_run")
+    # One listing of the repo root answers which top-level files exist, so
+    # absent ones cost no HEAD/GET round-trip.
+    top_level = client.list_child_names(repo_prefix)
+    row.has_success_marker = "daylily.successful_run" in top_level
+
+    def read_top_level(name: str) -> tuple[str | None, str | None]:
+        if name not in top_level:
+            return None, "missing"
+        return client.read_text(f"{repo_prefix}{name}")
 
-    day_cmd_text, note = client.read_text(f"{repo_prefix}day_cmd.log")
+    day_cmd_text, note = read_top_level("day_cmd.log")
     if note and note != "missing":
         row.note_items.append(note)
     row.has_day_cmd_log = day_cmd_text is not None
@@ -473,7 +497,7 @@ def inventory_repo(
     )
     row.coverage_or_experiment_ids = unique_join(extract_coverage_values(unit_rows))
 
-    stats_text, stats_note = client.read_text(f"{repo_prefix}day_pipe_stats.json")
+    stats_text, stats_note = read_top_level("day_pipe_stats.json")
     if stats_note and stats_note != "missing":
         row.note_items.append(stats_note)
     (
@@ -757,15 +781,19 @@ def run(args: argparse.Namespace) -> int:
 
     rows: list[InventoryRow] = []
     commands: list[CommandEntry] = []
-    for fsx_export, analysis_code, repo_prefix in repos:
-        row, command_entries = inventory_repo(
-            client,
-            fsx_export=fsx_export,
-            analysis_code=analysis_code,
-            repo_prefix=repo_prefix,
+    with ThreadPoolExecutor(max_workers=REPO_WORKERS) as executor:
+        results = executor.map(
+            lambda repo: inventory_repo(
+                client,
+                fsx_export=repo[0],
+                analysis_code=repo[1],
+                repo_prefix=repo[2],
+            ),
+            repos,
         )
-        rows.append(row)
-        commands.extend(command_entries)
+        for row, command_entries in results:
+            rows.append(row)
+            commands.extend(command_entries)
 
     row_payloads = [
         row.finalize()
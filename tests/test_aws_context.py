@@ -170,3 +170,36 @@ class TestAWSContextBuild:
         assert ctx.iam_username == "sess"
         assert ctx.region == "eu-west-1"
 
+
+# ── AWSContext.client ────────────────────────────────────────────────
+
+
+class TestAWSContextClient:
+    def test_default_clients_are_cached_per_service(self):
+        session = MagicMock()
+        ctx = AWSContext(profile="p", region="us-west-2", region_az="us-west-2b", _session=session)
+
+        first = ctx.client("iam")
+        assert ctx.client("iam") is first
+        ctx.client("ec2")
+
+        assert [c.args for c in session.client.call_args_list] == [("iam",), ("ec2",)]
+
+    def test_kwargs_bypass_cache(self):
+        session = MagicMock()
+        ctx = AWSContext(profile="p", region="us-west-2", region_az="us-west-2b", _session=session)
+
+        ctx.client("s3", region_name="us-east-1")
+        ctx.client("s3", region_name="us-east-1")
+
+        assert session.client.call_count == 2
+
+    def test_default_clients_use_adaptive_retries_and_keepalive(self):
+        session = MagicMock()
+        ctx = AWSContext(profile="p", region="us-west-2", region_az="us-west-2b", _session=session)
+
+        ctx.client("ec2")
+
+        config = session.client.call_args.kwargs["config"]
+        assert config.retries == {"mode": "adaptive", "max_attempts": 10}
+        assert config.tcp_keepalive is True
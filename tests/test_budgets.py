@@ -4,11 +4,15 @@ from __future__ import annotations
 
 from unittest.mock import MagicMock
 
+import pytest
+from botocore.exceptions import ClientError
+
 from daylily_ec.aws.budgets import (
     CLUSTER_THRESHOLDS,
     GLOBAL_BUDGET_NAME,
     GLOBAL_THRESHOLDS,
     TAGS_FILE_S3_SUFFIX,
+    TAGS_FILE_WRITE_ATTEMPTS,
     _build_budget_dict,
     _notification_dict,
     _subscriber_dict,
@@ -52,7 +56,7 @@ def _s3_client(existing_body=None):
         )
         c.get_object.return_value = resp
     else:
-        c.get_object.side_effect = Exception("NoSuchKey")
+        c.get_object.side_effect = ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
     return c
 
 
@@ -153,6 +157,18 @@ class TestBudgetExists:
         c.describe_budgets.side_effect = Exception("forbidden")
         assert budget_exists(c, "123", "foo") is False
 
+    def test_follows_next_token(self):
+        c = MagicMock()
+        c.describe_budgets.side_effect = [
+            {"Budgets": [{"BudgetName": "bar"}], "NextToken": "page-2"},
+            {"Budgets": [{"BudgetName": "foo"}]},
+        ]
+        assert budget_exists(c, "123", "foo") is True
+        assert c.describe_budgets.call_args_list[1].kwargs == {
+            "AccountId": "123",
+            "NextToken": "page-2",
+        }
+
 
 # ===================================================================
 # cluster_budget_name
@@ -257,6 +273,61 @@ class TestUpdateTagsFile:
         body = c.put_object.call_args.kwargs["Body"].decode("utf-8")
         assert body == "p\tubuntu,alice,bob\n"
 
+    def test_create_is_conditional_on_absence(self):
+        c = _s3_client(existing_body=None)
+        update_tags_file(c, "b", "p", "u", "r")
+        assert c.put_object.call_args.kwargs["IfNoneMatch"] == "*"
+        assert "IfMatch" not in c.put_object.call_args.kwargs
+
+    def test_retries_after_concurrent_append(self):
+        c = MagicMock()
+        versions = iter(
+            [
+                ("a\tubuntu\n", '"etag-1"'),
+                ("a\tubuntu\nb\tubuntu\n", '"etag-2"'),
+            ]
+        )
+
+        def fake_get_object(**kwargs):
+            body, etag = next(versions)
+            return {"Body": MagicMock(read=MagicMock(return_value=body.encode())), "ETag": etag}
+
+        c.get_object.side_effect = fake_get_object
+        c.put_object.side_effect = [
+            ClientError({"Error": {"Code": "PreconditionFailed"}}, "PutObject"),
+            {},
+        ]
+
+        update_tags_file(c, "bkt", "p", "u", "r")
+
+        assert c.put_object.call_count == 2
+        final = c.put_object.call_args.kwargs
+        assert final["IfMatch"] == '"etag-2"'
+        assert final["Body"].decode() == "a\tubuntu\nb\tubuntu\np\tubuntu,u\n"
+
+    def test_gives_up_when_contention_persists(self):
+        c = _s3_client(existing_body=None)
+        c.put_object.side_effect = ClientError(
+            {"Error": {"Code": "PreconditionFailed"}}, "PutObject"
+        )
+        with pytest.raises(RuntimeError, match="kept changing"):
+            update_tags_file(c, "b", "p", "u", "r")
+        assert c.put_object.call_count == TAGS_FILE_WRITE_ATTEMPTS
+
+    def test_other_put_errors_propagate(self):
+        c = _s3_client(existing_body=None)
+        c.put_object.side_effect = ClientError({"Error": {"Code": "AccessDenied"}}, "PutObject")
+        with pytest.raises(ClientError):
+            update_tags_file(c, "b", "p", "u", "r")
+        c.put_object.assert_called_once()
+
+    def test_read_errors_other_than_missing_propagate(self):
+        c = _s3_client(existing_body=None)
+        c.get_object.side_effect = ClientError({"Error": {"Code": "AccessDenied"}}, "GetObject")
+        with pytest.raises(ClientError, match="AccessDenied"):
+            update_tags_file(c, "b", "p", "u", "r")
+        c.put_object.assert_not_called()
+
 
 # ===================================================================
 # ensure_global_budget
@@ -163,6 +163,8 @@ class TestDeleteWorkflow:
             rc = run_delete_workflow(DeleteOptions(None, None, None))
 
         assert rc == 0
+        fsx_calls = [c for c in session.client.call_args_list if c.args == ("fsx",)]
+        assert len(fsx_calls) == 1
         mock_start_delete.assert_called_once_with("alpha", "us-west-2", profile="prof")
         mock_wait.assert_called_once_with(
             "alpha",
@@ -212,7 +212,7 @@ def _fake_aws_command_for_ont_prefix(
             ("s3api", "complete-multipart-upload"),
             ("s3api", "abort-multipart-upload"),
             ("s3", "cp"),
-            ("s3", "rm"),
+            ("s3api", "delete-objects"),
         }:
             return _completed(args)
         raise AssertionError(f"Unhandled fake AWS command: {args}")
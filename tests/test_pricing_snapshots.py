@@ -101,3 +101,41 @@ def test_collect_pricing_snapshot_skips_missing_prices():
         if point.instance_type == "r7i.metal-48xl" and point.availability_zone == "us-west-2b"
     ]
     assert skipped == []
+
+
+def test_collect_pricing_snapshot_covers_every_region_in_order():
+    snapshot = collect_pricing_snapshot(
+        regions=["us-west-2", "eu-central-1", "ap-south-1"],
+        partitions=["i192bigmem"],
+        session_factory=_fake_session_factory,
+    )
+
+    regions = [point.region for point in snapshot.points]
+    assert set(regions) == {"us-west-2", "eu-central-1", "ap-south-1"}
+    assert regions == sorted(regions)
+    assert all(point.availability_zone.startswith(point.region) for point in snapshot.points)
+
+
+def test_collect_pricing_snapshot_prices_shared_instance_types_once():
+    lookups: list[tuple[str, str]] = []
+
+    class _CountingEC2Client(_FakeEC2Client):
+        def describe_spot_price_history(self, InstanceTypes, AvailabilityZone, **kwargs):  # noqa: N803
+            lookups.append((AvailabilityZone, InstanceTypes[0]))
+            return super().describe_spot_price_history(
+                InstanceTypes=InstanceTypes, AvailabilityZone=AvailabilityZone, **kwargs
+            )
+
+    class _CountingSession:
+        def client(self, service_name: str, region_name: str):
+            return _CountingEC2Client(region_name=region_name)
+
+    snapshot = collect_pricing_snapshot(
+        regions=["us-west-2"],
+        partitions=["i192", "i192mem", "i192bigmem"],
+        session_factory=lambda profile: _CountingSession(),
+    )
+
+    assert len(lookups) == len(set(lookups))
+    shared = {p.partition for p in snapshot.points if p.instance_type == "r7i.48xlarge"}
+    assert shared == {"i192", "i192mem", "i192bigmem"}
@@ -183,6 +183,16 @@ class TestWriteInitArtifacts:
         )
         assert Path(yaml_init).read_text() == MINI_TEMPLATE
 
+    def test_yaml_init_does_not_inherit_template_mode(self, tmp_path: Path):
+        tpl = self._write_template(tmp_path)
+        tpl.chmod(0o444)
+        out_dir = tmp_path / "out"
+        yaml_init, _ = write_init_artifacts(
+            "prod", "20260211140000", str(tpl), MINIMAL_SUBS,
+            config_dir=out_dir,
+        )
+        assert Path(yaml_init).stat().st_mode & 0o200
+
     def test_init_template_is_rendered(self, tmp_path: Path):
         tpl = self._write_template(tmp_path)
         out_dir = tmp_path / "out"
@@ -143,6 +143,17 @@ def test_overlap_detection_rejects_active_fsx_and_s3_prefixes() -> None:
         )
 
 
+def test_auto_import_events_accept_any_case_and_dedupe() -> None:
+    assert run_mounts.parse_auto_import_events("new, Changed,NEW deleted") == [
+        "NEW",
+        "CHANGED",
+        "DELETED",
+    ]
+    assert run_mounts.parse_auto_import_events("off") == []
+    with pytest.raises(run_mounts.RunMountError, match="Unsupported FSx S3 event type"):
+        run_mounts.parse_auto_import_events("new,renamed")
+
+
 def test_auto_export_rejected_without_admin_override() -> None:
     with pytest.raises(run_mounts.RunMountError, match="forbidden"):
         run_mounts.parse_auto_export_events(
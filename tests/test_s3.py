@@ -8,6 +8,8 @@ from unittest.mock import MagicMock, patch
 from daylily_ec.aws.s3 import (
     BUCKET_NAME_FILTER,
     CORE_REFERENCE_PREFIXES,
+    GIAB_REFERENCE_PREFIXES,
+    REQUIRED_REFERENCE_PREFIXES,
     _resolve_bucket_region,
     _standard_s3_config,
     bucket_url,
@@ -193,6 +195,17 @@ class TestListCandidateBuckets:
             "z-omics-analysis",
         ]
 
+    def test_resolves_region_for_every_named_bucket(self):
+        names = [f"b{i:02d}-omics-analysis" for i in range(20)]
+        ctx = _make_aws_ctx(
+            buckets=names + ["unrelated"],
+            locations={n: ("us-west-2" if i % 2 else "eu-west-1") for i, n in enumerate(names)},
+            region="us-west-2",
+        )
+        result = list_candidate_buckets(ctx)
+        assert result == [n for i, n in enumerate(names) if i % 2]
+        assert ctx.client.return_value.get_bucket_location.call_count == 20
+
     def test_bucket_name_filter_constant(self):
         assert BUCKET_NAME_FILTER == "omics-analysis"
 
@@ -303,6 +316,23 @@ class TestVerifyReferenceBundle:
 
         assert not verify_reference_bundle("bucket")
 
+    @patch("daylily_ec.aws.s3._reference_bucket_s3_client")
+    def test_reports_missing_prefixes_in_declared_order(self, mock_client_factory, caplog):
+        client = _make_reference_s3_client(
+            missing_prefixes={GIAB_REFERENCE_PREFIXES[0], CORE_REFERENCE_PREFIXES[1]},
+        )
+        mock_client_factory.return_value = client
+
+        with caplog.at_level("ERROR", logger="daylily_ec.aws.s3"):
+            assert not verify_reference_bundle("bucket")
+
+        probed = [c.kwargs["Prefix"] for c in client.list_objects_v2.call_args_list]
+        assert sorted(probed) == sorted(REQUIRED_REFERENCE_PREFIXES)
+        assert (
+            f"missing objects under {CORE_REFERENCE_PREFIXES[1]}; "
+            f"missing objects under {GIAB_REFERENCE_PREFIXES[0]}"
+        ) in caplog.text
+
     @patch("daylily_ec.aws.s3._reference_bucket_s3_client")
     def test_no_profile_no_region(self, mock_client_factory):
         mock_client_factory.return_value = _make_reference_s3_client()
@@ -315,6 +345,11 @@ class TestStandardS3Config:
     def test_disables_accelerate_endpoint(self):
         assert _standard_s3_config().s3["use_accelerate_endpoint"] is False
 
+    def test_pool_covers_concurrent_reference_probes(self):
+        config = _standard_s3_config()
+        assert config.max_pool_connections >= len(REQUIRED_REFERENCE_PREFIXES) + 1
+        assert config.tcp_keepalive is True
+
 
 # ---------------------------------------------------------------------------
 # bucket_url
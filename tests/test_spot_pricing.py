@@ -148,6 +148,21 @@ class TestProcessSlurmQueues:
             for r in q["ComputeResources"]:
                 assert "SpotPrice" in r
 
+    def test_shared_instance_types_looked_up_once(self):
+        ec2 = _mock_ec2(1.0)
+        cfg = _config(
+            [
+                _queue(["m5.xlarge", "r6i.8xlarge"]),
+                _queue(["r6i.8xlarge"]),
+                _queue(["m5.xlarge"]),
+            ]
+        )
+        process_slurm_queues(cfg, "us-west-2a", ec2)
+        assert ec2.describe_spot_price_history.call_count == 2
+        for q in cfg["Scheduling"]["SlurmQueues"]:
+            for r in q["ComputeResources"]:
+                assert r["SpotPrice"] == round(1.0 + DEFAULT_BUMP_PRICE, 4)
+
     def test_empty_config_no_crash(self):
         ec2 = _mock_ec2()
         process_slurm_queues({}, "us-west-2a", ec2)
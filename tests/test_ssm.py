@@ -203,6 +203,31 @@ class TestRunShell:
         sent = client.send_command.call_args.kwargs
         assert "TimeoutSeconds" not in sent
 
+    @patch("daylily_ec.aws.ssm.time.sleep", return_value=None)
+    @patch("daylily_ec.aws.ssm.boto3.Session")
+    def test_poll_delay_doubles_up_to_poll_interval(self, mock_session_cls, mock_sleep):
+        pending = {
+            "Status": "InProgress",
+            "ResponseCode": -1,
+            "StandardOutputContent": "",
+            "StandardErrorContent": "",
+        }
+        client = MagicMock()
+        client.send_command.return_value = {"Command": {"CommandId": "cmd-1"}}
+        client.get_command_invocation.side_effect = [pending] * 5 + [
+            {
+                "Status": "Success",
+                "ResponseCode": 0,
+                "StandardOutputContent": "done\n",
+                "StandardErrorContent": "",
+            }
+        ]
+        mock_session_cls.return_value.client.return_value = client
+
+        run_shell("i-abc123", "us-west-2", "sleep 5", profile="dev", timeout=None, poll_interval=3)
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 1.0, 2.0, 3, 3]
+
     @pytest.mark.parametrize("as_user", [None, "root", "ssm-user"])
     @patch("daylily_ec.aws.ssm.boto3.Session")
     def test_rejects_non_ubuntu_users(self, mock_session_cls, as_user):
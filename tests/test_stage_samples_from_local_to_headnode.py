@@ -1,6 +1,14 @@
 from __future__ import annotations
 
+import datetime as dt
+import io
+import json
+import os
+import subprocess
+import sys
+import threading
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
@@ -83,6 +91,107 @@ def test_headnode_visible_path_maps_data_prefix_to_fsx() -> None:
     assert module.headnode_visible_path("/tmp/local") == "/tmp/local"
 
 
+def test_build_stage_paths_stamps_aware_utc_time(monkeypatch: pytest.MonkeyPatch) -> None:
+    now_calls: list[object] = []
+
+    class FrozenDatetime(dt.datetime):
+        @classmethod
+        def now(cls, tz=None):  # type: ignore[override]
+            now_calls.append(tz)
+            return dt.datetime(2026, 1, 2, 3, 4, 5, tzinfo=tz)
+
+        @classmethod
+        def utcnow(cls):  # type: ignore[override]
+            raise AssertionError("build_stage_paths must not use naive utcnow()")
+
+    monkeypatch.setattr(
+        module,
+        "dt",
+        SimpleNamespace(datetime=FrozenDatetime, timezone=dt.timezone),
+    )
+
+    paths = module.build_stage_paths("/data/staged_sample_data/", "s3://bucket/prefix")
+
+    assert now_calls == [dt.timezone.utc]
+    assert paths.remote_stage_name == "remote_stage_20260102T030405Z"
+    assert paths.remote_s3_stage == (
+        "s3://bucket/prefix/data/staged_sample_data/remote_stage_20260102T030405Z"
+    )
+
+
+def test_check_s3_path_probes_a_single_key(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[list[str]] = []
+    listings = {"reads/S1_R1.fastq.gz": {"Contents": [{"Key": "reads/S1_R1.fastq.gz"}]}}
+
+    def fake_aws_command(args, *, aws_env, debug, capture_output=False):
+        calls.append(list(args))
+        prefix = args[args.index("--prefix") + 1]
+        return subprocess.CompletedProcess(args, 0, stdout=json.dumps(listings.get(prefix, {})))
+
+    monkeypatch.setattr(module, "aws_command", fake_aws_command)
+
+    module.check_s3_path("s3://bucket/reads/S1_R1.fastq.gz", aws_env={}, debug=False)
+    with pytest.raises(module.CommandError, match="not accessible"):
+        module.check_s3_path("s3://bucket/reads/missing.fastq.gz", aws_env={}, debug=False)
+
+    assert calls[0] == [
+        "s3api",
+        "list-objects-v2",
+        "--bucket",
+        "bucket",
+        "--prefix",
+        "reads/S1_R1.fastq.gz",
+        "--max-items",
+        "1",
+        "--page-size",
+        "1",
+    ]
+
+
+def _fake_aws_cli(tmp_path: Path, body: str) -> dict[str, str]:
+    script = tmp_path / "bin" / "aws"
+    script.parent.mkdir()
+    script.write_text(f"#!{sys.executable}\nimport sys\n{body}\n", encoding="utf-8")
+    script.chmod(0o755)
+    return {**os.environ, "PATH": f"{script.parent}{os.pathsep}{os.environ.get('PATH', '')}"}
+
+
+def test_aws_command_binary_to_handle_drains_large_stderr(tmp_path: Path) -> None:
+    aws_env = _fake_aws_cli(
+        tmp_path,
+        "sys.stderr.write('w' * (1 << 20)); sys.stderr.flush()\n"
+        "sys.stdout.buffer.write(b'payload')",
+    )
+    handle = io.BytesIO()
+    errors: list[BaseException] = []
+
+    def copy() -> None:
+        try:
+            module.aws_command_binary_to_handle(
+                ["s3", "cp", "s3://b/k", "-"], handle, aws_env=aws_env
+            )
+        except BaseException as exc:  # pragma: no cover - surfaced below
+            errors.append(exc)
+
+    # A regression blocks on the full stderr pipe; fail instead of hanging the suite.
+    worker = threading.Thread(target=copy, daemon=True)
+    worker.start()
+    worker.join(timeout=30)
+
+    assert not worker.is_alive(), "stderr was not drained while streaming stdout"
+    assert errors == []
+    assert handle.getvalue() == b"payload"
+
+
+def test_aws_command_binary_to_handle_reports_stderr_on_failure(tmp_path: Path) -> None:
+    aws_env = _fake_aws_cli(tmp_path, "sys.stderr.write('AccessDenied'); sys.exit(1)")
+
+    with pytest.raises(module.CommandError, match="AccessDenied"):
+        module.aws_command_binary_to_handle(
+            ["s3", "cp", "s3://b/k", "-"], io.BytesIO(), aws_env=aws_env
+        )
+
+
 def test_check_source_path_accepts_mounted_paths_without_reference_translation(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -1367,6 +1476,25 @@ def test_precheck_run_metrics_preserves_relative_dirs_and_uses_basename(
     assert all(item.spec.platform == "ILMN" for item in files)
 
 
+def test_aws_copy_can_suppress_cli_progress(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[list[str]] = []
+    monkeypatch.setattr(
+        module,
+        "aws_command",
+        lambda args, **_kwargs: calls.append(list(args)),
+    )
+
+    module.aws_copy("s3://src/a.txt", "s3://dst/a.txt", aws_env={}, debug=False)
+    module.aws_copy(
+        "s3://src/a.txt", "s3://dst/a.txt", aws_env={}, debug=False, only_show_errors=True
+    )
+
+    assert calls == [
+        ["s3", "cp", "s3://src/a.txt", "s3://dst/a.txt"],
+        ["s3", "cp", "s3://src/a.txt", "s3://dst/a.txt", "--only-show-errors"],
+    ]
+
+
 def test_stage_run_metrics_copies_under_runs_subdir(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
@@ -1385,9 +1513,11 @@ def test_stage_run_metrics_copies_under_runs_subdir(
         ),
     ]
     copies: list[tuple[str, str]] = []
+    copy_kwargs: list[dict[str, object]] = []
 
-    def fake_aws_copy(source: str, destination: str, **_kwargs: object) -> None:
+    def fake_aws_copy(source: str, destination: str, **kwargs: object) -> None:
         copies.append((source, destination))
+        copy_kwargs.append(kwargs)
 
     monkeypatch.setattr(module, "aws_copy", fake_aws_copy)
 
@@ -1399,7 +1529,7 @@ def test_stage_run_metrics_copies_under_runs_subdir(
         debug=False,
     )
 
-    assert copies == [
+    assert sorted(copies) == [
         (
             "s3://reference-bucket/data/run_metrics/headnode.txt",
             "s3://bucket/data/staged_sample_data/remote_stage_test/runs/RUN-1/headnode.txt",
@@ -1413,6 +1543,7 @@ def test_stage_run_metrics_copies_under_runs_subdir(
         "/data/staged_sample_data/remote_stage_test/runs/RUN-1/headnode.txt",
         "/data/staged_sample_data/remote_stage_test/runs/RUN-1/qc/report.json",
     ]
+    assert all(kwargs.get("only_show_errors") is True for kwargs in copy_kwargs)
 
 
 def test_precheck_run_metrics_rejects_duplicate_destination_paths(
@@ -1693,6 +1824,47 @@ def test_precheck_manifest_collects_multiple_row_errors(
     assert "SAMPLE_ID=S2" in failure
 
 
+def test_precheck_manifest_probes_repeated_sources_once(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    shared_r2 = "s3://missing/shared_R2.fastq.gz"
+    analysis_samples = _write_manifest(
+        tmp_path,
+        _minimal_ilmn_header(),
+        [
+            _minimal_ilmn_row(sample_id="S1", r1="s3://bucket/S1_R1.fastq.gz", r2=shared_r2),
+            _minimal_ilmn_row(sample_id="S2", r1="s3://bucket/S2_R1.fastq.gz", r2=shared_r2),
+        ],
+    )
+    checked_paths: list[str] = []
+
+    def fake_check_source_path(path: str, **_kwargs: object) -> None:
+        checked_paths.append(path)
+        if path.startswith("s3://missing/"):
+            raise module.CommandError(f"S3 object or prefix not accessible: {path}")
+
+    monkeypatch.setattr(module, "check_source_path", fake_check_source_path)
+
+    report, _rows = module.precheck_manifest(
+        analysis_samples,
+        reference_bucket="s3://bucket",
+        aws_env={},
+        debug=False,
+    )
+
+    assert sorted(checked_paths) == [
+        "s3://bucket/S1_R1.fastq.gz",
+        "s3://bucket/S2_R1.fastq.gz",
+        shared_r2,
+    ]
+    assert report.source_objects_checked == 4
+    assert [(issue.row_number, issue.sample_id, issue.field) for issue in report.issues] == [
+        (2, "S1", "ILMN_R2_FQ"),
+        (3, "S2", "ILMN_R2_FQ"),
+    ]
+
+
 def test_precheck_manifest_collects_multiple_structural_errors_in_one_row(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
@@ -2175,3 +2347,82 @@ def test_main_precheck_only_bad_manifest_reports_aggregated_errors(
     assert "Precheck failed; no files were copied." in captured.err
     assert "SAMPLE_ID=S1" in captured.err
     assert "SAMPLE_ID=S2" in captured.err
+
+
+def _read_delete_spec(args: list[str]) -> dict:
+    spec_arg = args[args.index("--delete") + 1]
+    assert spec_arg.startswith("file://")
+    return json.loads(Path(spec_arg[len("file://") :]).read_text(encoding="utf-8"))
+
+
+def test_cleanup_s3_objects_batches_deletes_per_bucket(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[list[str]] = []
+    specs: list[dict] = []
+
+    def fake_aws_command(args, *, aws_env, debug, capture_output=False):
+        calls.append(list(args))
+        specs.append(_read_delete_spec(list(args)))
+        if args[3] == "other":
+            raise module.CommandError("denied")
+        return subprocess.CompletedProcess(args, 0, stdout="")
+
+    monkeypatch.setattr(module, "aws_command", fake_aws_command)
+    monkeypatch.setattr(module, "S3_DELETE_BATCH_SIZE", 2)
+
+    module.cleanup_s3_objects(
+        [
+            "s3://bucket/a.fastq.gz",
+            "s3://other/x.fastq.gz",
+            "s3://bucket/b.fastq.gz",
+            "s3://bucket/c.fastq.gz",
+        ],
+        aws_env={},
+        debug=False,
+    )
+
+    assert [call[:4] for call in calls] == [
+        ["s3api", "delete-objects", "--bucket", "bucket"],
+        ["s3api", "delete-objects", "--bucket", "bucket"],
+        ["s3api", "delete-objects", "--bucket", "other"],
+    ]
+    deleted = [spec["Objects"] for spec in specs[:2]]
+    assert deleted == [
+        [{"Key": "a.fastq.gz"}, {"Key": "b.fastq.gz"}],
+        [{"Key": "c.fastq.gz"}],
+    ]
+    assert not any(Path(call[5][len("file://") :]).exists() for call in calls)
+
+
+def test_cleanup_s3_objects_keeps_full_batches_under_the_argument_limit(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    uris = [
+        "s3://bucket/data/staged_sample_data/remote_stage_20260102T030405Z/RUN-1/S1/_parts/"
+        f"S1_ont_bundle{index:04d}_{'0' * 32}.fastq.gz"
+        for index in range(module.S3_DELETE_BATCH_SIZE)
+    ]
+    calls: list[list[str]] = []
+    specs: list[dict] = []
+
+    def fake_aws_command(args, *, aws_env, debug, capture_output=False):
+        calls.append(list(args))
+        specs.append(_read_delete_spec(list(args)))
+        return subprocess.CompletedProcess(args, 0, stdout="")
+
+    monkeypatch.setattr(module, "aws_command", fake_aws_command)
+
+    module.cleanup_s3_objects(uris, aws_env={}, debug=False)
+
+    assert len(calls) == 1
+    assert len(specs[0]["Objects"]) == module.S3_DELETE_BATCH_SIZE
+    assert len(json.dumps(specs[0])) > 128 * 1024
+    assert max(len(arg.encode("utf-8")) for arg in calls[0]) < 128 * 1024
+
+
+def test_cleanup_s3_objects_swallows_os_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fake_aws_command(args, *, aws_env, debug, capture_output=False):
+        raise OSError(7, "Argument list too long")
+
+    monkeypatch.setattr(module, "aws_command", fake_aws_command)
+
+    module.cleanup_s3_objects(["s3://bucket/a.fastq.gz"], aws_env={}, debug=False)
@@ -0,0 +1,28 @@
+"""Tests for daylily_ec.util.yaml_loader."""
+
+from __future__ import annotations
+
+import io
+
+import pytest
+import yaml
+
+from daylily_ec.util.yaml_loader import SafeLoader, safe_load
+
+
+def test_matches_pyyaml_safe_load():
+    text = "a: 1\nb: [x, 'y', null]\nc:\n  d: 2026-01-01\n  e: true\n"
+    assert safe_load(text) == yaml.safe_load(text)
+    assert safe_load(io.StringIO(text)) == yaml.safe_load(text)
+
+
+def test_rejects_python_tags():
+    with pytest.raises(yaml.YAMLError):
+        safe_load("!!python/object/apply:os.system ['true']")
+
+
+def test_uses_libyaml_when_available():
+    if getattr(yaml, "__with_libyaml__", False):
+        assert SafeLoader is yaml.CSafeLoader
+    else:
+        assert SafeLoader is yaml.SafeLoader